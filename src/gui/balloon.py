@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from functools import partial
+from functools import lru_cache, partial
 
 import customtkinter
 from PIL import Image
@@ -20,6 +20,12 @@ from PIL import Image
 BALLOON_SIZE = (305, 80)
 
 
+@lru_cache(maxsize=None)
+def _get_balloon_image(image_path: str):
+    return customtkinter.CTkImage(Image.open(image_path).resize(BALLOON_SIZE),
+                                  size=BALLOON_SIZE)
+
+
 class Balloon():
 
     def __init__(self, master, image_path: str):
@@ -34,8 +40,7 @@ class Balloon():
         # Hide icon in taskbar
         self.float_window.wm_attributes('-toolwindow', 'True')
 
-        self.balloon_image = customtkinter.CTkImage(
-            Image.open(image_path).resize(BALLOON_SIZE), size=BALLOON_SIZE)
+        self.balloon_image = _get_balloon_image(image_path)
 
         self.label = customtkinter.CTkLabel(
             self.float_window,
@@ -14,10 +14,9 @@
 
 import logging
 import tkinter
-from functools import partial
+from functools import lru_cache, partial
 
 import customtkinter
-import numpy as np
 from PIL import Image
 
 from src.config_manager import ConfigManager
@@ -29,6 +28,35 @@ logger = logging.getLogger("PageCursor")
 MAX_ROWS = 3
 HELP_ICON_SIZE = (18, 18)
 MAX_HOLD_TRIG = 2000
+ENTRY_UPDATE_DELAY_MS = 40
+
+# (show name, config name, balloon text, slider min, slider max)
+_DIRECTIONS = (
+    ("Move up", "spd_up", "", 0, 100),
+    ("Move down", "spd_down", "", 0, 100),
+    ("Move right", "spd_right", "", 0, 100),
+    ("Move left", "spd_left", "", 0, 100),
+    ("(Advanced) Smooth pointer", "pointer_smooth",
+     "Controls the smoothness of the\nmouse cursor. Enables the user\nto reduce jitteriness",
+     1, 100),
+    ("(Advanced) Smooth blendshapes", "shape_smooth",
+     "Reduces the flickering of the action\ntrigger", 1, 100),
+    ("(Advanced) Hold trigger delay(ms)", "hold_trigger_ms",
+     "Controls how long the user should\nhold a gesture in milliseconds\nfor an action to trigger",
+     1, MAX_HOLD_TRIG),
+)
+
+
+@lru_cache(maxsize=None)
+def _get_help_icon():
+    return customtkinter.CTkImage(
+        Image.open("assets/images/help.png").resize(HELP_ICON_SIZE),
+        size=HELP_ICON_SIZE)
+
+
+@lru_cache(maxsize=None)
+def _get_bold_font():
+    return customtkinter.CTkFont(weight='bold')
 
 
 class FrameSelectGesture(SafeDisposableFrame):
@@ -43,34 +71,19 @@ class FrameSelectGesture(SafeDisposableFrame):
         self.grid_rowconfigure(MAX_ROWS, weight=1)
         self.grid_columnconfigure(1, weight=1)
         self.slider_dragging = False
-        self.help_icon = customtkinter.CTkImage(
-            Image.open("assets/images/help.png").resize(HELP_ICON_SIZE),
-            size=HELP_ICON_SIZE)
+        self._pending_after = {}
+        self._suppress_trace = False
+        self._div_names = {}
+        self._last_applied = {}
+        self._cfg = ConfigManager()
+        self._mouse = MouseController()
+        self.help_icon = _get_help_icon()
 
         self.shared_info_balloon = Balloon(
             self, image_path="assets/images/balloon.png")
 
         # Slider divs
-        self.divs = self.create_divs({
-            "Move up": ["spd_up", "", 0, 100],
-            "Move down": ["spd_down", "", 0, 100],
-            "Move right": ["spd_right", "", 0, 100],
-            "Move left": ["spd_left", "", 0, 100],
-            "(Advanced) Smooth pointer": [
-                "pointer_smooth",
-                "Controls the smoothness of the\nmouse cursor. Enables the user\nto reduce jitteriness",
-                1, 100
-            ],
-            "(Advanced) Smooth blendshapes": [
-                "shape_smooth", "Reduces the flickering of the action\ntrigger",
-                1, 100
-            ],
-            "(Advanced) Hold trigger delay(ms)": [
-                "hold_trigger_ms",
-                "Controls how long the user should\nhold a gesture in milliseconds\nfor an action to trigger",
-                1, MAX_HOLD_TRIG
-            ]
-        })
+        self.divs = self.create_divs(_DIRECTIONS)
 
         self.load_initial_config()
 
@@ -80,22 +93,22 @@ class FrameSelectGesture(SafeDisposableFrame):
 
         for cfg_name, div in self.divs.items():
 
-            cfg_value = int(
-                np.clip(ConfigManager().config[cfg_name],
-                        a_min=1,
-                        a_max=MAX_HOLD_TRIG))
+            cfg_value = max(
+                1, min(MAX_HOLD_TRIG, int(self._cfg.config[cfg_name])))
             div["slider"].set(cfg_value)
+            self._last_applied[cfg_name] = self._cfg.config[cfg_name]
             # Temporary remove trace, adjust the value and put it back
-            div["entry_var"].trace_vdelete("w", div["entry_trace_id"])
+            div["entry_var"].trace_remove("write", div["entry_trace_id"])
             div["entry_var"].set(cfg_value)
-            div["entry_trace_id"] = div["entry_var"].trace(
-                "w", div["entry_trace_fn"])
+            div["entry_trace_id"] = div["entry_var"].trace_add(
+                "write", self.entry_changed_callback)
 
-    def create_divs(self, directions: dict):
+    def create_divs(self, directions: tuple):
         out_dict = {}
+        bold_font = _get_bold_font()
 
-        for idx, (show_name, (cfg_name, balloon_text, slider_min,
-                              slider_max)) in enumerate(directions.items()):
+        for idx, (show_name, cfg_name, balloon_text, slider_min,
+                  slider_max) in enumerate(directions):
 
             help_image = self.help_icon if balloon_text != "" else None
             # Label
@@ -103,8 +116,8 @@ class FrameSelectGesture(SafeDisposableFrame):
                                            image=help_image,
                                            compound='right',
                                            text=show_name,
+                                           font=bold_font,
                                            justify=tkinter.LEFT)
-            label.cget("font").configure(weight='bold')
             label.grid(row=idx, column=0, padx=20, pady=(10, 10), sticky="nw")
             self.shared_info_balloon.register_widget(label, balloon_text)
 
@@ -117,17 +130,15 @@ class FrameSelectGesture(SafeDisposableFrame):
                                              command=partial(
                                                  self.slider_drag_callback,
                                                  cfg_name))
-            slider.bind("<Button-1>",
-                        partial(self.slider_mouse_down_callback, cfg_name))
-            slider.bind("<ButtonRelease-1>",
-                        partial(self.slider_mouse_up_callback, cfg_name))
+            slider.bind("<ButtonRelease-1>", self.slider_mouse_up_callback)
+            self._div_names[str(slider)] = cfg_name
             slider.grid(row=idx, column=0, padx=30, pady=(40, 10), sticky="nw")
 
             # Number entry
             entry_var = tkinter.StringVar()
-            entry_trace_fn = partial(self.entry_changed_callback, cfg_name,
-                                     slider_min, slider_max)
-            entry_var_trace_id = entry_var.trace("w", entry_trace_fn)
+            entry_var_trace_id = entry_var.trace_add(
+                "write", self.entry_changed_callback)
+            self._div_names[str(entry_var)] = cfg_name
             entry = customtkinter.CTkEntry(
                 master=self,
                 validate='all',
@@ -146,7 +157,8 @@ class FrameSelectGesture(SafeDisposableFrame):
                 "entry": entry,
                 "entry_var": entry_var,
                 "entry_trace_id": entry_var_trace_id,
-                "entry_trace_fn": entry_trace_fn
+                "slider_min": slider_min,
+                "slider_max": slider_max
             }
         return out_dict
 
@@ -154,33 +166,33 @@ class FrameSelectGesture(SafeDisposableFrame):
         slider_min = int(slider_min)
         slider_max = int(slider_max)
 
-        if str.isdigit(P):
-            P = int(P)
-
-            if P < slider_min:
-                return False
-            elif P > slider_max:
-                return False
-
-            return True
-        else:
+        # Plain ASCII digits only, int() also takes "1_0", " 5 " or "+5"
+        if not (P.isascii() and P.isdigit()):
             return False
 
-    def entry_changed_callback(self, div_name, slider_min, slider_max, var,
-                               index, mode):
+        return slider_min <= int(P) <= slider_max
+
+    def entry_changed_callback(self, var, index, mode):
         """Update value with entery text 
         """
+        # Skip validation for values written by the slider itself
+        if self._suppress_trace:
+            return
+
         is_valid_input = True
+        div_name = self._div_names[var]
         div = self.divs[div_name]
+        slider_min = div["slider_min"]
+        slider_max = div["slider_max"]
 
         entry_value = div["entry_var"].get()
 
         # Check if valid input
-        if not str.isdigit(entry_value):
+        if not (entry_value.isascii() and entry_value.isdigit()):
             is_valid_input = False
         else:
             new_value = int(entry_value)
-            if not new_value in range(slider_min, slider_max):
+            if not slider_min <= new_value <= slider_max:
                 is_valid_input = False
 
         # Update slider and config
@@ -190,9 +202,7 @@ class FrameSelectGesture(SafeDisposableFrame):
 
             # Don't update config when dragging
             if not self.slider_dragging:
-                ConfigManager().set_temp_config(field=div_name, value=new_value)
-                ConfigManager().apply_config()
-                MouseController().calc_smooth_kernel()
+                self.apply_value(div_name, new_value)
         else:
             div["entry"].configure(fg_color="#ee9e9d")
 
@@ -201,19 +211,52 @@ class FrameSelectGesture(SafeDisposableFrame):
         """
         self.slider_dragging = True
         new_value = int(new_value)
+
+        # Coalesce rapid drag events into a single entry update
+        self.cancel_pending_entry_update(div_name)
+        self._pending_after[div_name] = self.after(
+            ENTRY_UPDATE_DELAY_MS,
+            partial(self.set_entry_silently, div_name, new_value))
+
+    def set_entry_silently(self, div_name: str, new_value: int):
+        """Update entry text without triggering the entry trace
+        """
+        self._suppress_trace = True
+        try:
+            self.divs[div_name]["entry_var"].set(new_value)
+        finally:
+            self._suppress_trace = False
+
+    def cancel_pending_entry_update(self, div_name: str):
+        after_id = self._pending_after.pop(div_name, None)
+        if after_id is not None:
+            self.after_cancel(after_id)
+
+    def slider_mouse_up_callback(self, event):
+        # Slider events are raised by its inner canvas
+        div_name = self._div_names.get(str(event.widget.master))
+        if div_name is None:
+            logger.warning(f"No slider div for widget {event.widget}")
+            return
         div = self.divs[div_name]
+        new_value = int(div["slider"].get())
+
+        # Flush the pending entry update before applying
+        self.cancel_pending_entry_update(div_name)
         div["entry_var"].set(new_value)
+        self.slider_dragging = False
 
-    def slider_mouse_down_callback(self, div_name: str, event):
-        self.slider_dragging = True
+        self.apply_value(div_name, new_value)
 
-    def slider_mouse_up_callback(self, div_name: str, event):
-        self.slider_dragging = False
-        div = self.divs[div_name]
-        new_value = int(div["entry_var"].get())
-        ConfigManager().set_temp_config(field=div_name, value=new_value)
-        ConfigManager().apply_config()
-        MouseController().calc_smooth_kernel()
+    def apply_value(self, div_name: str, new_value: int):
+        """Write value to config, skip if it is already applied
+        """
+        if self._last_applied.get(div_name) == new_value:
+            return
+        self._cfg.set_temp_config(field=div_name, value=new_value)
+        self._cfg.apply_config()
+        self._mouse.calc_smooth_kernel()
+        self._last_applied[div_name] = new_value
 
     def inner_refresh_profile(self):
         self.load_initial_config()
@@ -249,9 +292,15 @@ class PageCursor(SafeDisposableFrame):
         des_label.cget("font").configure(size=14)
         des_label.grid(row=1, column=0, padx=20, pady=5, sticky="nw")
 
-        # Inner frame
-        self.inner_frame = FrameSelectGesture(self)
-        self.inner_frame.grid(row=2, column=0, padx=5, pady=5, sticky="nw")
+        # Inner frame, built on first enter
+        self.inner_frame = None
+
+    def enter(self):
+        super().enter()
+        if self.inner_frame is None:
+            self.inner_frame = FrameSelectGesture(self)
+            self.inner_frame.grid(row=2, column=0, padx=5, pady=5, sticky="nw")
 
     def refresh_profile(self):
-        self.inner_frame.inner_refresh_profile()
+        if self.inner_frame is not None:
+            self.inner_frame.inner_refresh_profile()